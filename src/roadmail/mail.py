@@ -3,23 +3,40 @@ RoadMail - Email Sending for BlackRoad
 Send emails with templates, attachments, and tracking.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter, OrderedDict
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from datetime import datetime
+from email.generator import BytesGenerator
+from email.message import Message
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.base import MIMEBase
-from email import encoders
 from enum import Enum
+from itertools import chain
+from os import urandom
 from typing import Any, Callable, Dict, List, Optional, Tuple
 import asyncio
-import base64
+import binascii
+import functools
+import io
 import logging
 import re
 import smtplib
-import uuid
+import socket
+import threading
+import warnings
+
+try:
+    import aiosmtplib
+except ImportError:
+    aiosmtplib = None
 
 logger = logging.getLogger(__name__)
 
+_PH_RE = re.compile(r"\{\{\s*([^{}]+?)\s*\}\}")
+
 
 class EmailStatus(str, Enum):
     PENDING = "pending"
@@ -37,18 +54,41 @@ class Attachment:
     filename: str
     content: bytes
     content_type: str = "application/octet-stream"
-
-
-@dataclass
+    _main: str = field(init=False, repr=False, compare=False)
+    _sub: str = field(init=False, repr=False, compare=False)
+    _b64: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        main, _, sub = self.content_type.partition("/")
+        if not (main and sub):
+            main, sub = "application", "octet-stream"
+        self._main, self._sub = main, sub
+        encoded = binascii.b2a_base64(self.content, newline=False)
+        self._b64 = b"\r\n".join(encoded[i:i + 76] for i in range(0, len(encoded), 76)).decode("ascii")
+
+    @functools.cached_property
+    def _mime_part(self) -> MIMEBase:
+        part = MIMEBase(self._main, self._sub)
+        part.set_payload(self._b64)
+        part["Content-Transfer-Encoding"] = "base64"
+        part.add_header("Content-Disposition", f"attachment; filename={self.filename}")
+        return part
+
+
+@dataclass(frozen=True)
 class EmailAddress:
     email: str
     name: str = ""
 
-    def __str__(self) -> str:
+    @functools.cached_property
+    def formatted(self) -> str:
         if self.name:
             return f"{self.name} <{self.email}>"
         return self.email
 
+    def __str__(self) -> str:
+        return self.formatted
+
 
 @dataclass
 class Email:
@@ -70,6 +110,13 @@ class Email:
     tracking_id: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    @functools.cached_property
+    def _envelope_recipients(self) -> Tuple[str, ...]:
+        return tuple(dict.fromkeys(addr.email for addr in chain(self.to, self.cc, self.bcc)))
+
+    def reset_envelope(self) -> None:
+        self.__dict__.pop("_envelope_recipients", None)
+
 
 @dataclass
 class EmailTemplate:
@@ -80,63 +127,219 @@ class EmailTemplate:
     body_html: str = ""
     variables: List[str] = field(default_factory=list)
 
+    _pattern: Optional[re.Pattern] = field(default=None, init=False, repr=False, compare=False)
+    _has_placeholders: bool = field(default=True, init=False, repr=False, compare=False)
+    _source: Optional[Tuple] = field(default=None, init=False, repr=False, compare=False)
+
+    def _compile(self) -> None:
+        self.variables = tuple(self.variables)
+        self._source = (self.subject, self.body_text, self.body_html, self.variables)
+        if self.variables:
+            self._pattern = re.compile(r"\{\{\s*(" + "|".join(map(re.escape, self.variables)) + r")\s*\}\}")
+        else:
+            self._pattern = _PH_RE
+        self._has_placeholders = bool(self._pattern.search(self.subject + self.body_text + self.body_html))
+
+    def _ensure_compiled(self) -> bool:
+        if self._source == (self.subject, self.body_text, self.body_html, self.variables):
+            return False
+        self._compile()
+        return True
+
     def render(self, context: Dict[str, Any]) -> Tuple[str, str, str]:
-        subject = self.subject
-        body_text = self.body_text
-        body_html = self.body_html
+        self._ensure_compiled()
+        if not context or not self._has_placeholders:
+            return self.subject, self.body_text, self.body_html
         
-        for key, value in context.items():
-            placeholder = f"{{{{{key}}}}}"
-            subject = subject.replace(placeholder, str(value))
-            body_text = body_text.replace(placeholder, str(value))
-            body_html = body_html.replace(placeholder, str(value))
-        
-        return subject, body_text, body_html
+        sub = lambda m: str(context.get(m.group(1), m.group(0)))
+        return (
+            self._pattern.sub(sub, self.subject),
+            self._pattern.sub(sub, self.body_text),
+            self._pattern.sub(sub, self.body_html),
+        )
 
 
-class SMTPTransport:
+class _SMTPBase:
     def __init__(self, host: str, port: int, username: str = "", password: str = "", use_tls: bool = True):
         self.host = host
         self.port = port
         self.username = username
         self.password = password
         self.use_tls = use_tls
+        self._conn = None
+        self._cached_content_bytes = functools.lru_cache(maxsize=256)(self._content_bytes)
+
+    def clone(self):
+        return type(self)(self.host, self.port, self.username, self.password, self.use_tls)
+
+    @staticmethod
+    def _flatten(msg: Message) -> bytes:
+        buf = io.BytesIO()
+        BytesGenerator(buf, mangle_from_=False, policy=msg.policy.clone(linesep="\r\n")).flatten(msg)
+        return buf.getvalue()
+
+    def _build_content(self, body_text: str, body_html: str, attachments: List[Attachment]) -> Message:
+        if body_text and body_html:
+            body = MIMEMultipart("alternative")
+            body.attach(MIMEText(body_text, "plain"))
+            body.attach(MIMEText(body_html, "html"))
+        else:
+            body = MIMEText(body_html or body_text, "html" if body_html else "plain")
+        
+        if not attachments:
+            return body
+        
+        msg = MIMEMultipart("mixed")
+        msg.attach(body)
+        for attachment in attachments:
+            msg.attach(attachment._mime_part)
+        return msg
 
-    def send(self, email: Email) -> bool:
-        msg = MIMEMultipart("alternative")
+    def _content_bytes(self, body_text: str, body_html: str) -> bytes:
+        return self._flatten(self._build_content(body_text, body_html, []))
+
+    def _header_bytes(self, email: Email) -> bytes:
+        msg = Message()
         msg["Subject"] = email.subject
-        msg["From"] = str(email.from_addr)
-        msg["To"] = ", ".join(str(addr) for addr in email.to)
+        msg["From"] = email.from_addr.formatted
+        msg["To"] = ", ".join(addr.formatted for addr in email.to)
         
         if email.cc:
-            msg["Cc"] = ", ".join(str(addr) for addr in email.cc)
+            msg["Cc"] = ", ".join(addr.formatted for addr in email.cc)
         if email.reply_to:
-            msg["Reply-To"] = str(email.reply_to)
+            msg["Reply-To"] = email.reply_to.formatted
         
         for key, value in email.headers.items():
             msg[key] = value
-        
-        if email.body_text:
-            msg.attach(MIMEText(email.body_text, "plain"))
-        if email.body_html:
-            msg.attach(MIMEText(email.body_html, "html"))
-        
-        for attachment in email.attachments:
-            part = MIMEBase(*attachment.content_type.split("/"))
-            part.set_payload(attachment.content)
-            encoders.encode_base64(part)
-            part.add_header("Content-Disposition", f"attachment; filename={attachment.filename}")
-            msg.attach(part)
-        
+        # Drop the blank line that separates headers from the (empty) body.
+        return self._flatten(msg)[:-2]
+
+    def _message_bytes(self, email: Email) -> bytes:
+        if email.attachments:
+            content = self._flatten(self._build_content(email.body_text, email.body_html, email.attachments))
+        else:
+            content = self._cached_content_bytes(email.body_text, email.body_html)
+        return self._header_bytes(email) + content
+
+
+class SMTPTransport(_SMTPBase):
+    def __init__(self, host: str, port: int, username: str = "", password: str = "", use_tls: bool = True):
+        super().__init__(host, port, username, password, use_tls)
+        self._conn: Optional[smtplib.SMTP] = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "SMTPTransport":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.host, self.port)
+        try:
+            if self.use_tls:
+                server.starttls()
+            if self.username:
+                server.login(self.username, self.password)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    def _get_connection(self) -> smtplib.SMTP:
+        if self._conn is not None:
+            try:
+                self._conn.noop()
+                return self._conn
+            except (smtplib.SMTPException, socket.error):
+                self._drop_connection()
+        self._conn = self._connect()
+        return self._conn
+
+    def _drop_connection(self) -> None:
+        if self._conn is None:
+            return
+        try:
+            self._conn.close()
+        finally:
+            self._conn = None
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._conn.quit()
+            except (smtplib.SMTPException, socket.error):
+                pass
+            self._drop_connection()
+
+    def send(self, email: Email) -> bool:
+        data = self._message_bytes(email)
+        recipients = email._envelope_recipients
         try:
-            with smtplib.SMTP(self.host, self.port) as server:
-                if self.use_tls:
-                    server.starttls()
+            with self._lock:
+                try:
+                    self._get_connection().sendmail(email.from_addr.email, recipients, data)
+                except (smtplib.SMTPServerDisconnected, socket.error):
+                    self._drop_connection()
+                    raise
+            return True
+        except Exception as e:
+            logger.error(f"SMTP error: {e}")
+            raise
+
+
+class AsyncSMTPTransport(_SMTPBase):
+    def __init__(self, host: str, port: int, username: str = "", password: str = "", use_tls: bool = True):
+        if aiosmtplib is None:
+            raise ImportError("AsyncSMTPTransport requires aiosmtplib (pip install roadmail[async])")
+        super().__init__(host, port, username, password, use_tls)
+        self._conn: Optional["aiosmtplib.SMTP"] = None
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "AsyncSMTPTransport":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def _get_connection(self) -> "aiosmtplib.SMTP":
+        async with self._lock:
+            if self._conn is not None and self._conn.is_connected:
+                return self._conn
+            server = aiosmtplib.SMTP(hostname=self.host, port=self.port, start_tls=self.use_tls)
+            await server.connect()
+            try:
                 if self.username:
-                    server.login(self.username, self.password)
-                
-                recipients = [addr.email for addr in email.to + email.cc + email.bcc]
-                server.sendmail(email.from_addr.email, recipients, msg.as_string())
+                    await server.login(self.username, self.password)
+            except Exception:
+                server.close()
+                raise
+            self._conn = server
+            return server
+
+    async def close(self) -> None:
+        async with self._lock:
+            if self._conn is None:
+                return
+            try:
+                await self._conn.quit()
+            except aiosmtplib.SMTPException:
+                self._conn.close()
+            self._conn = None
+
+    async def send(self, email: Email) -> bool:
+        data = self._message_bytes(email)
+        recipients = email._envelope_recipients
+        try:
+            server = await self._get_connection()
+            try:
+                await server.sendmail(email.from_addr.email, recipients, data)
+            except aiosmtplib.SMTPServerDisconnected:
+                if self._conn is server:
+                    self._conn = None
+                raise
             return True
         except Exception as e:
             logger.error(f"SMTP error: {e}")
@@ -152,91 +355,313 @@ class MockTransport:
         self.sent_emails.append(email)
         return True
 
+    def __enter__(self) -> "MockTransport":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        pass
+
 
 class Mailer:
-    def __init__(self, transport: Any = None, default_from: EmailAddress = None):
+    def __init__(self, transport: Any = None, default_from: EmailAddress = None,
+                 max_history: int = 10_000, retain_bodies: bool = True, strict_hooks: bool = True,
+                 max_smtp_conns: int = 8):
+        if max_history < 0:
+            raise ValueError(f"max_history must be >= 0, got {max_history}")
         self.transport = transport or MockTransport()
         self.default_from = default_from or EmailAddress("noreply@example.com")
         self.templates: Dict[str, EmailTemplate] = {}
-        self.sent_emails: Dict[str, Email] = {}
-        self.hooks: Dict[str, List[Callable]] = {
-            "before_send": [], "after_send": [], "on_error": []
-        }
+        self.sent_emails: "OrderedDict[str, Email]" = OrderedDict()
+        self.max_history = max_history
+        self.retain_bodies = retain_bodies
+        self.strict_hooks = strict_hooks
+        self._before_send: Tuple[Callable, ...] = ()
+        self._after_send: Tuple[Callable, ...] = ()
+        self._on_error: Tuple[Callable, ...] = ()
+        self._has_hooks = False
+        self.max_smtp_conns = max_smtp_conns
+        self._executor = ThreadPoolExecutor(max_workers=max_smtp_conns, thread_name_prefix="roadmail")
+        self._local = threading.local()
+        self._executor_transports: List[Any] = []
+        self._status_counts: Counter = Counter()
+        self._counted: Dict[str, EmailStatus] = {}
+        self._lock = threading.Lock()
+        self._render_cached = functools.lru_cache(maxsize=1024)(self._render)
+
+    def __enter__(self) -> "Mailer":
+        return self
 
-    def add_hook(self, event: str, handler: Callable) -> None:
-        if event in self.hooks:
-            self.hooks[event].append(handler)
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _close_worker_transports(self, transports: List[Any]) -> None:
+        for transport in transports:
+            if hasattr(transport, "close"):
+                transport.close()
+        transports.clear()
+
+    def close(self) -> None:
+        self._executor.shutdown()
+        self._close_worker_transports(self._executor_transports)
+        close = getattr(self.transport, "close", None)
+        if close and self._is_async_transport():
+            warnings.warn("Mailer.close() cannot close an async transport; await Mailer.aclose() instead",
+                          RuntimeWarning, stacklevel=2)
+        elif close:
+            close()
+
+    async def __aenter__(self) -> "Mailer":
+        return self
 
-    def _emit(self, event: str, email: Email) -> None:
-        for handler in self.hooks.get(event, []):
-            try:
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        self._executor.shutdown(wait=False)
+        self._close_worker_transports(self._executor_transports)
+        close = getattr(self.transport, "close", None)
+        if close:
+            result = close()
+            if asyncio.iscoroutine(result):
+                await result
+
+    def _is_async_transport(self) -> bool:
+        return asyncio.iscoroutinefunction(getattr(self.transport, "send", None))
+
+    @property
+    def hooks(self) -> Dict[str, Tuple[Callable, ...]]:
+        return {"before_send": self._before_send, "after_send": self._after_send, "on_error": self._on_error}
+
+    def add_hook(self, event: str, handler: Callable) -> None:
+        if event in ("before_send", "after_send", "on_error"):
+            attr = f"_{event}"
+            setattr(self, attr, getattr(self, attr) + (handler,))
+            self._has_hooks = True
+
+    def _emit(self, handlers: Tuple[Callable, ...], email: Email) -> None:
+        # A failing hook skips the rest of that event's hooks unless strict_hooks is off.
+        if not self.strict_hooks:
+            for handler in handlers:
+                try:
+                    handler(email)
+                except Exception as e:
+                    logger.error(f"Hook error: {e}")
+            return
+        try:
+            for handler in handlers:
                 handler(email)
-            except Exception as e:
-                logger.error(f"Hook error: {e}")
+        except Exception as e:
+            logger.error(f"Hook error: {e}")
 
     def register_template(self, template: EmailTemplate) -> None:
+        template._compile()
         self.templates[template.id] = template
+        self._render_cached.cache_clear()
+
+    def _render(self, template_id: str, context_items: frozenset) -> Tuple[str, str, str]:
+        return self.templates[template_id].render(dict(context_items))
+
+    def _set_status(self, email: Email, status: EmailStatus) -> None:
+        with self._lock:
+            email.status = status
+            # Only emails already in history are counted; _record counts the rest.
+            if self.sent_emails.get(email.id) is email:
+                self._status_counts[self._counted[email.id]] -= 1
+                self._status_counts[status] += 1
+                self._counted[email.id] = status
+
+    def update_status(self, email_id: str, status: EmailStatus) -> Optional[Email]:
+        email = self.sent_emails.get(email_id)
+        if email is not None:
+            self._set_status(email, status)
+        return email
 
-    def send(self, to: List[str], subject: str, body_text: str = "", body_html: str = "", **kwargs) -> Email:
+    def _record(self, email: Email) -> None:
+        if email.status == EmailStatus.SENT and not self.retain_bodies:
+            email.attachments = []
+            email.body_html = ""
+        
+        with self._lock:
+            # Counters follow the status last counted per id, so outside writes to email.status can't skew them.
+            counted = self._counted.get(email.id)
+            if counted is not None:
+                self._status_counts[counted] -= 1
+            self._status_counts[email.status] += 1
+            self._counted[email.id] = email.status
+            self.sent_emails[email.id] = email
+            self.sent_emails.move_to_end(email.id)
+            while len(self.sent_emails) > self.max_history:
+                evicted_id, _ = self.sent_emails.popitem(last=False)
+                self._status_counts[self._counted.pop(evicted_id)] -= 1
+
+    def _build_email(self, to: List[str], subject: str, body_text: str = "", body_html: str = "", **kwargs) -> Email:
         recipients = [EmailAddress(email=addr) if isinstance(addr, str) else addr for addr in to]
         
-        email = Email(
-            id=str(uuid.uuid4())[:12],
+        return Email(
+            id=urandom(6).hex(),
             to=recipients,
             subject=subject,
             body_text=body_text,
             body_html=body_html,
-            from_addr=kwargs.get("from_addr", self.default_from),
-            tracking_id=str(uuid.uuid4())[:8],
-            **{k: v for k, v in kwargs.items() if k != "from_addr"}
+            from_addr=kwargs.pop("from_addr", None) or self.default_from,
+            tracking_id=urandom(4).hex(),
+            **kwargs
         )
-        
-        self._emit("before_send", email)
-        email.status = EmailStatus.SENDING
-        
-        try:
-            self.transport.send(email)
-            email.status = EmailStatus.SENT
+
+    def send(self, to: List[str], subject: str, body_text: str = "", body_html: str = "", **kwargs) -> Email:
+        return self._send_prepared(self._build_email(to, subject, body_text, body_html, **kwargs))
+
+    def submit(self, email: Email) -> Email:
+        if email.from_addr is None:
+            email.from_addr = self.default_from
+        # Clear state left by a previous attempt; recipients may have been edited since.
+        email.error = None
+        email.sent_at = None
+        email.reset_envelope()
+        return self._send_prepared(email)
+
+    def _before_delivery(self, email: Email) -> None:
+        if self._has_hooks:
+            self._emit(self._before_send, email)
+        self._set_status(email, EmailStatus.SENDING)
+
+    def _after_delivery(self, email: Email, error: Optional[Exception] = None) -> Email:
+        if error is None:
+            self._set_status(email, EmailStatus.SENT)
             email.sent_at = datetime.now()
-            self._emit("after_send", email)
-        except Exception as e:
-            email.status = EmailStatus.FAILED
-            email.error = str(e)
-            self._emit("on_error", email)
+            if self._has_hooks:
+                self._emit(self._after_send, email)
+        else:
+            self._set_status(email, EmailStatus.FAILED)
+            email.error = str(error)
+            if self._has_hooks:
+                self._emit(self._on_error, email)
         
-        self.sent_emails[email.id] = email
+        self._record(email)
         return email
 
-    def send_template(self, template_id: str, to: List[str], context: Dict[str, Any] = None, **kwargs) -> Optional[Email]:
+    def _bind_thread_transport(self, registry: List[Any]) -> None:
+        # Give the calling worker thread its own clone (and so its own SMTP connection).
+        if getattr(self._local, "source", None) is self.transport:
+            return
+        clone = getattr(self.transport, "clone", None)
+        transport = self.transport
+        if clone:
+            transport = clone()
+            with self._lock:
+                registry.append(transport)
+        self._local.source = self.transport
+        self._local.transport = transport
+
+    def _thread_transport(self) -> Any:
+        if getattr(self._local, "source", None) is self.transport:
+            return self._local.transport
+        return self.transport
+
+    def _send_in_executor(self, *args, **kwargs) -> Email:
+        self._bind_thread_transport(self._executor_transports)
+        return self.send(*args, **kwargs)
+
+    def _require_sync_transport(self) -> None:
+        if self._is_async_transport():
+            raise TypeError("Mailer has an async transport; use send_async, send_async_bulk or send_template_async")
+
+    def _send_prepared(self, email: Email) -> Email:
+        self._require_sync_transport()
+        self._before_delivery(email)
+        try:
+            self._thread_transport().send(email)
+        except Exception as e:
+            return self._after_delivery(email, e)
+        return self._after_delivery(email)
+
+    async def _send_prepared_async(self, email: Email) -> Email:
+        self._before_delivery(email)
+        try:
+            await self.transport.send(email)
+        except Exception as e:
+            return self._after_delivery(email, e)
+        return self._after_delivery(email)
+
+    def _render_template(self, template_id: str, context: Optional[Dict[str, Any]]) -> Optional[Tuple[str, str, str]]:
         template = self.templates.get(template_id)
         if not template:
             logger.error(f"Template not found: {template_id}")
             return None
         
-        subject, body_text, body_html = template.render(context or {})
+        if template._ensure_compiled():
+            self._render_cached.cache_clear()
+        # Key on the rendered form of each value, so the memo never holds context objects.
+        return self._render_cached(template_id, frozenset((k, str(v)) for k, v in (context or {}).items()))
+
+    def send_template(self, template_id: str, to: List[str], context: Dict[str, Any] = None, **kwargs) -> Optional[Email]:
+        rendered = self._render_template(template_id, context)
+        if rendered is None:
+            return None
+        subject, body_text, body_html = rendered
         return self.send(to, subject, body_text, body_html, **kwargs)
 
+    async def send_template_async(self, template_id: str, to: List[str], context: Dict[str, Any] = None, **kwargs) -> Optional[Email]:
+        rendered = self._render_template(template_id, context)
+        if rendered is None:
+            return None
+        subject, body_text, body_html = rendered
+        return await self.send_async(to, subject, body_text, body_html, **kwargs)
+
     async def send_async(self, *args, **kwargs) -> Email:
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, lambda: self.send(*args, **kwargs))
+        if self._is_async_transport():
+            return await self._send_prepared_async(self._build_email(*args, **kwargs))
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, lambda: self._send_in_executor(*args, **kwargs))
+
+    async def send_async_bulk(self, emails: List[Dict[str, Any]]) -> List[Email]:
+        if not self._is_async_transport():
+            return list(await asyncio.gather(*(self.send_async(**email_data) for email_data in emails)))
+        
+        session = self.transport if hasattr(self.transport, "__aenter__") else nullcontext()
+        async with session:
+            return list(await asyncio.gather(
+                *(self._send_prepared_async(self._build_email(**email_data)) for email_data in emails)
+            ))
+
+    def send_bulk(self, emails: List[Dict[str, Any]], pipeline: bool = False, max_workers: int = None) -> List[Email]:
+        self._require_sync_transport()
+        if pipeline and len(emails) > 1:
+            return self._send_bulk_pipelined(emails, max_workers or min(self.max_smtp_conns, len(emails)))
+        
+        prepared = [self._build_email(**email_data) for email_data in emails]
+        session = self.transport if hasattr(self.transport, "__enter__") else nullcontext()
+        with session:
+            return [self._send_prepared(email) for email in prepared]
+
+    def _send_bulk_pipelined(self, emails: List[Dict[str, Any]], max_workers: int) -> List[Email]:
+        prepared = [self._build_email(**email_data) for email_data in emails]
+        worker_transports = []
+
+        def worker(email: Email) -> Email:
+            self._bind_thread_transport(worker_transports)
+            return self._send_prepared(email)
 
-    def send_bulk(self, emails: List[Dict[str, Any]]) -> List[Email]:
-        results = []
-        for email_data in emails:
-            result = self.send(**email_data)
-            results.append(result)
-        return results
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="roadmail") as pool:
+                futures = [pool.submit(worker, email) for email in prepared]
+                return [future.result() for future in futures]
+        finally:
+            self._close_worker_transports(worker_transports)
 
     def get_email(self, email_id: str) -> Optional[Email]:
         return self.sent_emails.get(email_id)
 
     def stats(self) -> Dict[str, int]:
-        emails = list(self.sent_emails.values())
+        counts = self._status_counts
         return {
-            "total": len(emails),
-            "sent": len([e for e in emails if e.status == EmailStatus.SENT]),
-            "failed": len([e for e in emails if e.status == EmailStatus.FAILED]),
-            "pending": len([e for e in emails if e.status == EmailStatus.PENDING])
+            "total": len(self.sent_emails),
+            "sent": counts[EmailStatus.SENT],
+            "failed": counts[EmailStatus.FAILED],
+            "pending": counts[EmailStatus.PENDING]
         }
 
 
@@ -301,6 +726,21 @@ class EmailBuilder:
             "attachments": self._attachments
         }
 
+    def build_email(self) -> Email:
+        return Email(
+            id=urandom(6).hex(),
+            to=list(self._to),
+            subject=self._subject,
+            body_text=self._body_text,
+            body_html=self._body_html,
+            from_addr=self._from,
+            reply_to=self._reply_to,
+            cc=list(self._cc),
+            bcc=list(self._bcc),
+            attachments=list(self._attachments),
+            tracking_id=urandom(4).hex()
+        )
+
 
 def example_usage():
     mailer = Mailer()
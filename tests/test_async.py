@@ -0,0 +1,130 @@
+import asyncio
+
+import pytest
+
+from roadmail.mail import EmailStatus, EmailTemplate, Mailer
+
+
+class FakeAsyncTransport:
+    def __init__(self, fail_for=()):
+        self.sent = []
+        self.closed = False
+        self.fail_for = set(fail_for)
+
+    async def send(self, email):
+        await asyncio.sleep(0)
+        if email.subject in self.fail_for:
+            raise RuntimeError("boom")
+        self.sent.append(email)
+        return True
+
+    async def close(self):
+        self.closed = True
+
+
+class SessionAsyncTransport(FakeAsyncTransport):
+    def __init__(self):
+        super().__init__()
+        self.entered = 0
+
+    async def __aenter__(self):
+        self.entered += 1
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+def bulk(n):
+    return [dict(to=[f"user{i}@example.com"], subject=f"Hi {i}") for i in range(n)]
+
+
+def test_send_async_awaits_async_transport():
+    transport = FakeAsyncTransport()
+    mailer = Mailer(transport)
+    
+    email = asyncio.run(mailer.send_async(["a@example.com"], "Hi"))
+    
+    assert email.status == EmailStatus.SENT
+    assert transport.sent == [email]
+
+
+def test_send_async_bulk_without_session_protocol():
+    transport = FakeAsyncTransport(fail_for={"Hi 1"})
+    mailer = Mailer(transport)
+    
+    results = asyncio.run(mailer.send_async_bulk(bulk(3)))
+    
+    assert [e.subject for e in results] == ["Hi 0", "Hi 1", "Hi 2"]
+    assert [e.status for e in results] == [EmailStatus.SENT, EmailStatus.FAILED, EmailStatus.SENT]
+    assert results[1].error == "boom"
+    assert mailer.stats() == {"total": 3, "sent": 2, "failed": 1, "pending": 0}
+
+
+def test_send_async_bulk_holds_one_session():
+    transport = SessionAsyncTransport()
+    mailer = Mailer(transport)
+    
+    asyncio.run(mailer.send_async_bulk(bulk(4)))
+    
+    assert transport.entered == 1
+    assert transport.closed
+    assert len(transport.sent) == 4
+
+
+def test_send_async_bulk_with_sync_transport_uses_executor():
+    mailer = Mailer()
+    
+    results = asyncio.run(mailer.send_async_bulk(bulk(3)))
+    
+    assert all(e.status == EmailStatus.SENT for e in results)
+    assert len(mailer.transport.sent_emails) == 3
+    mailer.close()
+
+
+def test_send_template_async():
+    mailer = Mailer(FakeAsyncTransport())
+    mailer.register_template(EmailTemplate("t", "T", "Hi {{name}}"))
+    
+    email = asyncio.run(mailer.send_template_async("t", ["a@example.com"], {"name": "Ann"}))
+    
+    assert email.subject == "Hi Ann"
+    assert email.status == EmailStatus.SENT
+    assert asyncio.run(mailer.send_template_async("missing", ["a@example.com"])) is None
+
+
+def test_sync_paths_reject_async_transport():
+    transport = FakeAsyncTransport()
+    mailer = Mailer(transport)
+    
+    with pytest.raises(TypeError):
+        mailer.send(["a@example.com"], "Hi")
+    with pytest.raises(TypeError):
+        mailer.send_bulk(bulk(2))
+    with pytest.raises(TypeError):
+        mailer.send_bulk(bulk(2), pipeline=True)
+    assert transport.sent == []
+    assert mailer.stats()["total"] == 0
+
+
+def test_close_warns_for_async_transport_and_aclose_closes_it():
+    transport = FakeAsyncTransport()
+    mailer = Mailer(transport)
+    
+    with pytest.warns(RuntimeWarning, match="aclose"):
+        mailer.close()
+    assert not transport.closed
+    
+    asyncio.run(mailer.aclose())
+    assert transport.closed
+
+
+def test_async_context_manager_closes_transport():
+    transport = FakeAsyncTransport()
+    
+    async def run():
+        async with Mailer(transport) as mailer:
+            await mailer.send_async(["a@example.com"], "Hi")
+    
+    asyncio.run(run())
+    assert transport.closed
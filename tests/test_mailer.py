@@ -0,0 +1,228 @@
+import logging
+
+import pytest
+
+from roadmail.mail import Attachment, EmailAddress, EmailBuilder, EmailStatus, Mailer, MockTransport
+
+
+class FailingTransport:
+    def __init__(self, error: str = "boom"):
+        self.error = error
+
+    def send(self, email):
+        raise RuntimeError(self.error)
+
+
+def test_strict_hooks_skip_remaining_hooks_after_a_failure(caplog):
+    mailer = Mailer()
+    seen = []
+    mailer.add_hook("after_send", lambda e: 1 / 0)
+    mailer.add_hook("after_send", lambda e: seen.append(e.id))
+    
+    with caplog.at_level(logging.ERROR):
+        email = mailer.send(["a@example.com"], "Hi")
+    
+    assert email.status == EmailStatus.SENT
+    assert seen == []
+    assert "Hook error" in caplog.text
+
+
+def test_non_strict_hooks_isolate_each_handler():
+    mailer = Mailer(strict_hooks=False)
+    seen = []
+    mailer.add_hook("after_send", lambda e: 1 / 0)
+    mailer.add_hook("after_send", lambda e: seen.append(e.id))
+    
+    email = mailer.send(["a@example.com"], "Hi")
+    
+    assert email.status == EmailStatus.SENT
+    assert seen == [email.id]
+
+
+def test_hooks_fire_per_event():
+    mailer = Mailer(FailingTransport())
+    events = []
+    mailer.add_hook("before_send", lambda e: events.append(("before", e.status)))
+    mailer.add_hook("after_send", lambda e: events.append(("after", e.status)))
+    mailer.add_hook("on_error", lambda e: events.append(("error", e.status)))
+    mailer.add_hook("unknown", lambda e: events.append(("unknown", e.status)))
+    
+    mailer.send(["a@example.com"], "Hi")
+    
+    assert events == [("before", EmailStatus.PENDING), ("error", EmailStatus.FAILED)]
+    assert set(mailer.hooks) == {"before_send", "after_send", "on_error"}
+
+
+def test_emit_is_skipped_without_hooks(monkeypatch):
+    mailer = Mailer()
+    calls = []
+    monkeypatch.setattr(mailer, "_emit", lambda handlers, email: calls.append(handlers))
+    
+    mailer.send(["a@example.com"], "Hi")
+    assert not mailer._has_hooks
+    assert calls == []
+    
+    mailer.add_hook("after_send", lambda e: None)
+    mailer.send(["a@example.com"], "Hi")
+    assert mailer._has_hooks
+    assert len(calls) == 2
+
+
+def test_stats_count_sent_and_failed():
+    mailer = Mailer()
+    mailer.send(["a@example.com"], "One")
+    mailer.send(["b@example.com"], "Two")
+    mailer.transport = FailingTransport()
+    mailer.send(["c@example.com"], "Three")
+    
+    assert mailer.stats() == {"total": 3, "sent": 2, "failed": 1, "pending": 0}
+
+
+def test_stats_ignore_emails_that_never_reach_history():
+    mailer = Mailer()
+    with pytest.raises(TypeError):
+        mailer.send_bulk([{"to": ["a@example.com"], "subject": "a"}, {"subject": "b"}])
+    
+    assert mailer.stats() == {"total": 0, "sent": 0, "failed": 0, "pending": 0}
+
+
+def test_stats_after_resubmit():
+    mailer = Mailer(FailingTransport())
+    email = mailer.send(["a@example.com"], "Hi")
+    assert mailer.stats() == {"total": 1, "sent": 0, "failed": 1, "pending": 0}
+    
+    mailer.transport = MockTransport()
+    mailer.submit(email)
+    
+    assert mailer.stats() == {"total": 1, "sent": 1, "failed": 0, "pending": 0}
+
+
+def test_stats_after_eviction():
+    mailer = Mailer(FailingTransport(), max_history=2)
+    mailer.send(["a@example.com"], "One")
+    mailer.transport = MockTransport()
+    mailer.send(["b@example.com"], "Two")
+    mailer.send(["c@example.com"], "Three")
+    
+    assert mailer.stats() == {"total": 2, "sent": 2, "failed": 0, "pending": 0}
+    assert sum(mailer._status_counts.values()) == 2
+
+
+def test_update_status_moves_counts():
+    mailer = Mailer()
+    email = mailer.send(["a@example.com"], "Hi")
+    
+    assert mailer.update_status(email.id, EmailStatus.BOUNCED) is email
+    assert email.status == EmailStatus.BOUNCED
+    assert mailer.stats()["sent"] == 0
+    assert mailer._status_counts[EmailStatus.BOUNCED] == 1
+    assert mailer.update_status("missing", EmailStatus.BOUNCED) is None
+
+
+def test_outside_status_writes_do_not_corrupt_counts():
+    mailer = Mailer(max_history=2)
+    first = mailer.send(["a@example.com"], "One")
+    first.status = EmailStatus.BOUNCED
+    mailer.send(["b@example.com"], "Two")
+    mailer.send(["c@example.com"], "Three")
+    
+    assert mailer.stats() == {"total": 2, "sent": 2, "failed": 0, "pending": 0}
+    assert all(count >= 0 for count in mailer._status_counts.values())
+
+
+def test_history_evicts_oldest_first():
+    mailer = Mailer(max_history=2)
+    emails = [mailer.send(["a@example.com"], f"Hi {i}") for i in range(3)]
+    
+    assert list(mailer.sent_emails) == [emails[1].id, emails[2].id]
+    assert mailer.get_email(emails[0].id) is None
+    assert mailer.get_email(emails[2].id) is emails[2]
+
+
+def test_zero_history_keeps_nothing():
+    mailer = Mailer(max_history=0)
+    email = mailer.send(["a@example.com"], "Hi")
+    
+    assert email.status == EmailStatus.SENT
+    assert mailer.stats() == {"total": 0, "sent": 0, "failed": 0, "pending": 0}
+
+
+def test_negative_history_is_rejected():
+    with pytest.raises(ValueError):
+        Mailer(max_history=-1)
+
+
+def test_retain_bodies_false_drops_heavy_fields_after_send():
+    mailer = Mailer(retain_bodies=False)
+    attachments = [Attachment("a.txt", b"data", "text/plain")]
+    email = mailer.send(["a@example.com"], "Hi", "text", "<p>html</p>", attachments=attachments)
+    
+    assert email.body_text == "text"
+    assert email.body_html == ""
+    assert email.attachments == []
+
+
+def test_retain_bodies_false_keeps_failed_emails_intact():
+    mailer = Mailer(FailingTransport(), retain_bodies=False)
+    email = mailer.send(["a@example.com"], "Hi", "text", "<p>html</p>")
+    
+    assert email.status == EmailStatus.FAILED
+    assert email.body_html == "<p>html</p>"
+
+
+def test_build_email_keeps_builder_addresses():
+    builder = (EmailBuilder()
+        .to("a@example.com")
+        .cc("b@example.com")
+        .from_address("me@example.com", "Me")
+        .subject("Report")
+        .text("See attached")
+        .attach("r.txt", b"data", "text/plain"))
+    
+    email = builder.build_email()
+    
+    assert email.to == builder._to and email.to is not builder._to
+    assert email.cc == [EmailAddress("b@example.com")]
+    assert email.from_addr == EmailAddress("me@example.com", "Me")
+    assert email.attachments[0].filename == "r.txt"
+    assert email.status == EmailStatus.PENDING
+    assert email.id != builder.build_email().id
+
+
+def test_submit_sends_built_email_with_default_sender():
+    mailer = Mailer()
+    email = mailer.submit(EmailBuilder().to("a@example.com").subject("Hi").build_email())
+    
+    assert email.status == EmailStatus.SENT
+    assert email.from_addr == mailer.default_from
+    assert mailer.transport.sent_emails == [email]
+    assert mailer.stats() == {"total": 1, "sent": 1, "failed": 0, "pending": 0}
+
+
+def test_resubmit_after_failure_counts_once_and_clears_error():
+    mailer = Mailer(FailingTransport())
+    email = mailer.send(["a@example.com"], "Hi")
+    assert (email.status, email.error, email.sent_at) == (EmailStatus.FAILED, "boom", None)
+    
+    mailer.transport = MockTransport()
+    mailer.submit(email)
+    
+    assert email.status == EmailStatus.SENT
+    assert email.error is None
+    assert email.sent_at is not None
+    assert mailer.stats() == {"total": 1, "sent": 1, "failed": 0, "pending": 0}
+
+
+def test_resubmit_picks_up_edited_recipients():
+    seen = []
+    
+    class RecordingTransport:
+        def send(self, email):
+            seen.append(email._envelope_recipients)
+    
+    mailer = Mailer(RecordingTransport())
+    email = mailer.send(["a@example.com"], "Hi")
+    email.cc.append(EmailAddress("b@example.com"))
+    mailer.submit(email)
+    
+    assert seen == [("a@example.com",), ("a@example.com", "b@example.com")]
@@ -0,0 +1,112 @@
+from roadmail.mail import EmailTemplate, Mailer, _PH_RE
+
+
+def test_render_substitutes_declared_variables():
+    template = EmailTemplate("t", "T", "Hi {{name}}", "Welcome to {{app}}", "<b>{{name}}</b>", variables=["name", "app"])
+    
+    assert template.render({"name": "Ann", "app": "RoadMail"}) == ("Hi Ann", "Welcome to RoadMail", "<b>Ann</b>")
+
+
+def test_render_leaves_unknown_placeholders():
+    template = EmailTemplate("t", "T", "Hi {{name}} {{missing}}", variables=["name"])
+    
+    assert template.render({"name": "Ann", "missing": "x"})[0] == "Hi Ann {{missing}}"
+    assert EmailTemplate("t", "T", "Hi {{name}} {{missing}}").render({"name": "Ann"})[0] == "Hi Ann {{missing}}"
+
+
+def test_render_is_single_pass():
+    template = EmailTemplate("t", "T", "{{a}} {{b}}")
+    
+    assert template.render({"a": "{{b}}", "b": "B"})[0] == "{{b}} B"
+
+
+def test_render_tolerates_inner_whitespace_with_and_without_declared_variables():
+    for variables in ([], ["name"]):
+        template = EmailTemplate("t", "T", "Hi {{ name }} {{name}}", variables=variables)
+        assert template.render({"name": "X"})[0] == "Hi X X"
+
+
+def test_undeclared_templates_substitute_any_context_key():
+    template = EmailTemplate("t", "T", "Hi {{first-name}} {{user.name}} {{first name}} {{c}}")
+    context = {"first-name": "A", "user.name": "B", "first name": "D", "c": "C"}
+    
+    assert template.render(context)[0] == "Hi A B D C"
+
+
+def test_undeclared_templates_use_the_shared_pattern():
+    template = EmailTemplate("t", "T", "Hi {{name}}")
+    template._compile()
+    
+    assert template._pattern is _PH_RE
+    assert template.variables == ()
+
+
+def test_placeholder_free_templates_are_returned_as_is():
+    subject, body_text = "Password changed", "Your password was changed."
+    template = EmailTemplate("t", "T", subject, body_text)
+    
+    rendered = template.render({"name": "Ann"})
+    
+    assert not template._has_placeholders
+    assert rendered[0] is subject and rendered[1] is body_text
+
+
+def test_empty_context_returns_strings_as_is():
+    subject = "Hi {{name}}"
+    
+    assert EmailTemplate("t", "T", subject).render({})[0] is subject
+
+
+def test_render_recompiles_after_fields_change():
+    template = EmailTemplate("t", "T", "static")
+    assert template.render({"name": "Ann"})[0] == "static"
+    
+    template.subject = "Hi {{name}}"
+    assert template.render({"name": "Ann"})[0] == "Hi Ann"
+
+
+def test_mailer_render_cache_distinguishes_equal_values():
+    mailer = Mailer()
+    mailer.register_template(EmailTemplate("t", "T", "v={{n}}"))
+    
+    subjects = [mailer.send_template("t", ["a@example.com"], {"n": v}).subject for v in (1, True, 1.0, 1)]
+    
+    assert subjects == ["v=1", "v=True", "v=1.0", "v=1"]
+    assert mailer._render_cached.cache_info().hits == 1
+
+
+def test_mailer_render_cache_follows_str_of_mutable_values():
+    class User:
+        def __init__(self, name):
+            self.name = name
+
+        def __str__(self):
+            return self.name
+    
+    mailer = Mailer()
+    mailer.register_template(EmailTemplate("t", "T", "Hi {{user}}"))
+    user = User("old")
+    assert mailer.send_template("t", ["a@example.com"], {"user": user}).subject == "Hi old"
+    
+    user.name = "new"
+    assert mailer.send_template("t", ["a@example.com"], {"user": user}).subject == "Hi new"
+
+
+def test_mailer_sees_template_edits_after_registration():
+    mailer = Mailer()
+    template = EmailTemplate("t", "T", "static")
+    mailer.register_template(template)
+    assert mailer.send_template("t", ["a@example.com"], {"name": "Ann"}).subject == "static"
+    
+    template.subject = "Hi {{name}}"
+    assert mailer.send_template("t", ["a@example.com"], {"name": "Ann"}).subject == "Hi Ann"
+
+
+def test_register_template_compiles_and_freezes_variables():
+    mailer = Mailer()
+    template = EmailTemplate("t", "T", "Hi {{name}}", variables=["name"])
+    mailer.register_template(template)
+    
+    assert template.variables == ("name",)
+    assert template._pattern is not None
+    assert mailer.send_template("missing", ["a@example.com"]) is None
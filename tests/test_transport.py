@@ -0,0 +1,226 @@
+import asyncio
+import email
+import os
+import smtplib
+import threading
+
+import pytest
+
+from roadmail.mail import Attachment, Email, EmailAddress, EmailStatus, Mailer, SMTPTransport
+
+
+def make_email(**kwargs) -> Email:
+    defaults = dict(
+        id="abc123",
+        to=[EmailAddress("alice@example.com", "Alice")],
+        subject="Hello",
+        from_addr=EmailAddress("noreply@example.com"),
+    )
+    defaults.update(kwargs)
+    return Email(**defaults)
+
+
+def wire(msg: Email) -> bytes:
+    return SMTPTransport("localhost", 25)._message_bytes(msg)
+
+
+def assert_crlf_only(data: bytes) -> None:
+    assert data.count(b"\n") == data.count(b"\r\n")
+    assert data.count(b"\r") == data.count(b"\r\n")
+
+
+def test_text_only_is_single_part():
+    data = wire(make_email(body_text="plain body"))
+    assert_crlf_only(data)
+    
+    msg = email.message_from_bytes(data)
+    assert not msg.is_multipart()
+    assert msg.get_content_type() == "text/plain"
+    assert msg.get_payload(decode=True) == b"plain body"
+
+
+def test_html_only_is_single_part():
+    msg = email.message_from_bytes(wire(make_email(body_html="<p>hi</p>")))
+    assert msg.get_content_type() == "text/html"
+    assert msg.get_payload(decode=True) == b"<p>hi</p>"
+
+
+def test_text_and_html_is_alternative():
+    data = wire(make_email(body_text="plain", body_html="<p>rich</p>"))
+    assert_crlf_only(data)
+    
+    msg = email.message_from_bytes(data)
+    assert msg.get_content_type() == "multipart/alternative"
+    parts = msg.get_payload()
+    assert [p.get_content_type() for p in parts] == ["text/plain", "text/html"]
+    assert parts[0].get_payload(decode=True) == b"plain"
+    assert parts[1].get_payload(decode=True) == b"<p>rich</p>"
+
+
+def test_attachment_is_mixed_and_round_trips():
+    content = os.urandom(10_000)
+    data = wire(make_email(
+        body_text="plain",
+        body_html="<p>rich</p>",
+        attachments=[Attachment("report.bin", content, "application/pdf")],
+    ))
+    assert_crlf_only(data)
+    
+    msg = email.message_from_bytes(data)
+    assert msg.get_content_type() == "multipart/mixed"
+    body, attachment = msg.get_payload()
+    assert body.get_content_type() == "multipart/alternative"
+    assert attachment.get_content_type() == "application/pdf"
+    assert attachment.get_filename() == "report.bin"
+    assert attachment.get_payload(decode=True) == content
+
+
+def test_headers_are_kept():
+    data = wire(make_email(
+        body_text="plain",
+        cc=[EmailAddress("bob@example.com")],
+        reply_to=EmailAddress("support@example.com", "Support"),
+        headers={"X-Campaign": "spring", "List-Unsubscribe": "<mailto:unsub@example.com>"},
+    ))
+    msg = email.message_from_bytes(data)
+    assert msg["Subject"] == "Hello"
+    assert msg["From"] == "noreply@example.com"
+    assert msg["To"] == "Alice <alice@example.com>"
+    assert msg["Cc"] == "bob@example.com"
+    assert msg["Reply-To"] == "Support <support@example.com>"
+    assert msg["X-Campaign"] == "spring"
+    assert msg["List-Unsubscribe"] == "<mailto:unsub@example.com>"
+    assert msg.get_content_type() == "text/plain"
+
+
+def test_cached_body_is_reused_with_fresh_headers():
+    transport = SMTPTransport("localhost", 25)
+    first = email.message_from_bytes(transport._message_bytes(make_email(subject="One", body_text="same")))
+    second = email.message_from_bytes(transport._message_bytes(make_email(subject="Two", body_text="same")))
+    assert (first["Subject"], second["Subject"]) == ("One", "Two")
+    assert first.get_payload(decode=True) == second.get_payload(decode=True) == b"same"
+    assert transport._cached_content_bytes.cache_info().hits == 1
+
+
+class FakeSMTP:
+    instances = []
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.calls = []
+        self.sent = []
+        self.closed = False
+        self.alive = True
+        self.threads = set()
+        FakeSMTP.instances.append(self)
+
+    def starttls(self):
+        self.calls.append("starttls")
+
+    def login(self, username, password):
+        self.calls.append("login")
+
+    def noop(self):
+        if not self.alive:
+            raise smtplib.SMTPServerDisconnected("gone")
+        return 250, b"OK"
+
+    def sendmail(self, from_addr, to_addrs, msg):
+        self.threads.add(threading.get_ident())
+        self.sent.append((from_addr, tuple(to_addrs), msg))
+
+    def quit(self):
+        self.calls.append("quit")
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_smtp(monkeypatch):
+    FakeSMTP.instances = []
+    monkeypatch.setattr(smtplib, "SMTP", FakeSMTP)
+    return FakeSMTP
+
+
+def bulk(n):
+    return [dict(to=[f"user{i}@example.com"], subject=f"Hi {i}", body_text="hello") for i in range(n)]
+
+
+def test_connection_is_reused_across_sends(fake_smtp):
+    mailer = Mailer(SMTPTransport("smtp.example.com", 587, "user", "secret"))
+    
+    results = mailer.send_bulk(bulk(5))
+    
+    assert [e.status for e in results] == [EmailStatus.SENT] * 5
+    assert len(fake_smtp.instances) == 1
+    conn = fake_smtp.instances[0]
+    assert conn.calls == ["starttls", "login", "quit"]
+    assert len(conn.sent) == 5
+    assert conn.closed
+
+
+def test_close_quits_and_next_send_reconnects(fake_smtp):
+    transport = SMTPTransport("smtp.example.com", 587)
+    mailer = Mailer(transport)
+    
+    mailer.send(["a@example.com"], "One")
+    transport.close()
+    assert fake_smtp.instances[0].calls[-1] == "quit"
+    assert fake_smtp.instances[0].closed
+    assert transport._conn is None
+    
+    mailer.send(["a@example.com"], "Two")
+    assert len(fake_smtp.instances) == 2
+    mailer.close()
+    assert fake_smtp.instances[1].closed
+
+
+def test_dead_connection_is_replaced(fake_smtp):
+    transport = SMTPTransport("smtp.example.com", 25, use_tls=False)
+    mailer = Mailer(transport)
+    
+    mailer.send(["a@example.com"], "One")
+    fake_smtp.instances[0].alive = False
+    email = mailer.send(["a@example.com"], "Two")
+    
+    assert email.status == EmailStatus.SENT
+    assert len(fake_smtp.instances) == 2
+    assert fake_smtp.instances[0].closed
+    assert len(fake_smtp.instances[1].sent) == 1
+
+
+def test_pipelined_bulk_uses_one_connection_per_worker(fake_smtp):
+    mailer = Mailer(SMTPTransport("smtp.example.com", 587))
+    
+    results = mailer.send_bulk(bulk(40), pipeline=True, max_workers=4)
+    
+    assert [e.subject for e in results] == [f"Hi {i}" for i in range(40)]
+    assert all(e.status == EmailStatus.SENT for e in results)
+    assert 1 <= len(fake_smtp.instances) <= 4
+    assert sum(len(conn.sent) for conn in fake_smtp.instances) == 40
+    for conn in fake_smtp.instances:
+        assert len(conn.threads) == 1
+        assert conn.closed
+    assert mailer.transport._conn is None
+
+
+def test_send_async_workers_hold_their_own_connections(fake_smtp):
+    transport = SMTPTransport("smtp.example.com", 587)
+    mailer = Mailer(transport, max_smtp_conns=3)
+    
+    async def run():
+        return await asyncio.gather(*(mailer.send_async([f"u{i}@example.com"], f"Hi {i}") for i in range(30)))
+    
+    results = asyncio.run(run())
+    
+    assert all(e.status == EmailStatus.SENT for e in results)
+    assert transport._conn is None
+    assert 1 <= len(fake_smtp.instances) <= 3
+    assert sum(len(conn.sent) for conn in fake_smtp.instances) == 30
+    for conn in fake_smtp.instances:
+        assert len(conn.threads) == 1
+    
+    mailer.close()
+    assert all(conn.closed for conn in fake_smtp.instances)